@@ -1,13 +1,37 @@
 import sys
 import os
-import requests
+import json
+import logging
+import functools
+import hashlib
+import re
+import tempfile
+import time
 import threading
+import collections
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
+try:
+    # orjson parses and writes the large match payloads several times faster when it is installed
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    json_loads = json.loads
+    
+    def json_dumps(obj):
+        """Serialize obj to UTF-8 encoded JSON bytes, like orjson.dumps"""
+        return json.dumps(obj).encode("utf-8")
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                            QLabel, QLineEdit, QPushButton, QComboBox, QTextEdit, 
-                            QFrame, QGridLayout, QSplitter, QMessageBox, QProgressBar,
+                            QLabel, QLineEdit, QPushButton, QComboBox, 
+                            QFrame, QGridLayout, QMessageBox, QProgressBar,
                             QScrollArea, QDialog)
-from PyQt5.QtCore import Qt, QSize, pyqtSignal, QThread
-from PyQt5.QtGui import QFont, QIcon, QPixmap, QColor, QPalette
+from PyQt5.QtCore import Qt, pyqtSignal, QThread, QTimer
+from PyQt5.QtGui import QFont, QPixmap, QColor, QPainter
+
+log = logging.getLogger(__name__)
 
 # ====================================================
 # CONSTANTS AND CONFIGURATIONS
@@ -47,24 +71,298 @@ QUEUE_TYPES = {
     700: "Clash"
 }
 
+# Queue IDs skipped during analysis (ARAM and various TFT queues)
+EXCLUDED_QUEUES = frozenset({450, 1090, 1100, 1110, 1130, 1150, 1200})
+
+# Riot ID format: game name of 3-16 characters and a tag line of 3-5 characters
+RIOT_NAME_PATTERN = re.compile(r"[\w .]{3,16}")
+RIOT_TAG_PATTERN = re.compile(r"\w{3,5}")
+
+# Maximum number of match detail requests in flight at once
+MAX_CONCURRENT_REQUESTS = 10
+
+# Attempts per request before giving up on rate limits and server errors
+MAX_REQUEST_ATTEMPTS = 5
+
+# Seconds to wait for a connection and for each response read, so a stalled request fails
+# instead of blocking the analysis forever
+REQUEST_TIMEOUT = (5, 20)
+
+# Riot API rate limits for personal/development keys: (max requests, per seconds)
+RIOT_RATE_LIMITS = [(20, 1), (100, 120)]
+
+# Extra match IDs requested to make up for games that get filtered out
+EXTRA_MATCH_IDS = 5
+MAX_MATCH_IDS_PER_REQUEST = 100  # Riot API limit
+MAX_MATCH_HISTORY_SCANNED = 100  # Don't look further back than this many games
+
+# Directory for cached Riot API responses
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "hbiy")
+MATCH_CACHE_DIR = os.path.join(CACHE_DIR, "matches")
+PUUID_CACHE_PATH = os.path.join(CACHE_DIR, "puuid.json")
+
+# How long a player's recent match ID list is reused, in seconds
+MATCH_IDS_CACHE_TTL = 60
+
+# How long a Riot ID to PUUID lookup is reused, in seconds
+PUUID_CACHE_TTL = 24 * 60 * 60
+
+# Most match records kept in memory for re-analysis within a session
+MAX_MATCH_RECORDS = 2048
+
+# ====================================================
+# RIOT API RATE LIMITING
+# ====================================================
+
+class RateLimiter:
+    """
+    Thread-safe client-side limiter for Riot's per-key request limits
+    Spaces out requests so the parallel match fetches stay under every limit
+    instead of running into 429 responses
+    """
+    def __init__(self, limits):
+        self.limits = limits
+        self.lock = threading.Lock()
+        # Send times of the most recent requests, oldest first
+        self.sent = collections.deque(maxlen=max(count for count, _ in limits))
+        
+    def wait(self, stop_event=None):
+        """Block until a request can be sent without exceeding any limit
+        
+        Returns False without using up a request if stop_event is set while waiting.
+        """
+        while True:
+            if stop_event is not None and stop_event.is_set():
+                return False
+            with self.lock:
+                now = time.monotonic()
+                delay = 0
+                for max_requests, period in self.limits:
+                    # The window is full if the max_requests-th most recent request is still inside it
+                    if len(self.sent) >= max_requests:
+                        delay = max(delay, self.sent[-max_requests] + period - now)
+                if delay <= 0:
+                    self.sent.append(now)
+                    return True
+            if stop_event is not None:
+                stop_event.wait(delay)
+            else:
+                time.sleep(delay)
+
+# Shared by all workers, since the limits apply to the API key rather than a single analysis
+rate_limiter = RateLimiter(RIOT_RATE_LIMITS)
+
+class RequestCancelled(Exception):
+    """Raised instead of sending a request that is no longer needed"""
+
+# ====================================================
+# RIOT API HTTP SESSION
+# ====================================================
+
+# One session shared by all workers, so connections to Riot are kept alive and reused
+# across match fetches and across analyses
+riot_session = requests.Session()
+riot_session.headers["User-Agent"] = "Mozilla/5.0"  # Some APIs require a user agent
+
+# Retry transient server errors with exponential backoff. These retries are sent from
+# inside urllib3 and are not counted by the rate limiter; rate-limited (429) responses
+# are retried by ApiWorker.api_get instead, so those retries go through the limiter.
+riot_session.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=MAX_CONCURRENT_REQUESTS,
+    max_retries=Retry(total=MAX_REQUEST_ATTEMPTS - 1, backoff_factor=1,
+                      status_forcelist=[500, 502, 503, 504], raise_on_status=False)
+))
+
+# ====================================================
+# RIOT API RESPONSE CACHE
+# ====================================================
+
+def write_cache_file(path, data):
+    """Write JSON data to a cache file atomically (raises OSError on failure)"""
+    cache_dir = os.path.dirname(path)
+    os.makedirs(cache_dir, exist_ok=True)
+    # Write to a temporary file first so a crash never leaves a half-written cache entry
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(json_dumps(data))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+def api_key_hash(api_key):
+    """Short hash of an API key, used to keep cached data from different keys apart"""
+    # PUUIDs are encrypted per API key, so data cached under another key must not be reused.
+    # Only a short hash of the key is stored, never the key itself.
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12]
+
+def match_cache_path(key_hash, match_id):
+    """Path of the cached raw data for a match, fetched with the API key hashed to key_hash"""
+    return os.path.join(MATCH_CACHE_DIR, key_hash, f"{match_id}.json")
+
+def load_cached_match(key_hash, match_id):
+    """Load raw match data saved by a previous analysis (raises OSError if not cached)"""
+    with open(match_cache_path(key_hash, match_id), "rb") as f:
+        return json_loads(f.read())
+
+def save_cached_match(key_hash, match_id, data):
+    """Save raw match data to the disk cache - match data never changes once a game ends"""
+    try:
+        write_cache_file(match_cache_path(key_hash, match_id), data)
+    except OSError as e:
+        log.warning("Error caching match %s: %s", match_id, e)
+
+# Recent match ID pages kept for this session: (region, puuid, start, count) -> (fetch time, match IDs)
+match_ids_cache = {}
+
+def puuid_cache_key(key_hash, region, nick, tag):
+    """Build the PUUID cache key for a Riot ID looked up with the API key hashed to key_hash"""
+    return f"{key_hash}:{region}:{nick.lower()}#{tag.lower()}"
+
+@functools.lru_cache(maxsize=1)
+def load_puuid_cache():
+    """Load the Riot ID to PUUID map saved by previous analyses
+    
+    The file is only read once per process; the returned dict is shared and
+    updated in place, so lookups after the first one stay in memory.
+    """
+    try:
+        with open(PUUID_CACHE_PATH, "rb") as f:
+            return json_loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+def save_puuid_cache(cache):
+    """Save the Riot ID to PUUID map to disk"""
+    try:
+        write_cache_file(PUUID_CACHE_PATH, cache)
+    except OSError as e:
+        log.warning("Error caching PUUID: %s", e)
+
+# ====================================================
+# MATCH DATA PROCESSING
+# ====================================================
+
+# Structured match data built in this session: (match_id, puuid) -> record (None if filtered out),
+# least recently used first. Records hold all ten full participant dicts, so the size is capped.
+match_records = collections.OrderedDict()
+match_records_lock = threading.Lock()
+
+def get_match_record(match_id, puuid):
+    """Return the record built earlier in this session (raises KeyError if there is none)"""
+    with match_records_lock:
+        match_records.move_to_end((match_id, puuid))
+        return match_records[(match_id, puuid)]
+
+def store_match_record(match_id, puuid, record):
+    """Keep a record for this session, dropping the least recently used ones beyond MAX_MATCH_RECORDS"""
+    with match_records_lock:
+        match_records[(match_id, puuid)] = record
+        match_records.move_to_end((match_id, puuid))
+        while len(match_records) > MAX_MATCH_RECORDS:
+            match_records.popitem(last=False)
+
+def build_match_record(data, match_id, puuid):
+    """Build the structured match data used by the UI from raw match-v5 data"""
+    players = data["info"]["participants"]
+    
+    # Skip non-Summoner's Rift games
+    map_id = data["info"]["mapId"]
+    if map_id != 11:  # 11 is Summoner's Rift
+        return None
+        
+    # Skip ARAM, TFT, and other non-standard modes
+    queue_id = data["info"]["queueId"]
+    if queue_id in EXCLUDED_QUEUES:
+        return None
+    
+    # Divide players into teams, index them by position and find the player in a single pass
+    teams = {100: [], 200: []}  # Blue team, red team
+    teams_by_position = {100: dict.fromkeys(POSITIONS), 200: dict.fromkeys(POSITIONS)}
+    player = None
+    for p in players:
+        team_id = p["teamId"]
+        if team_id in teams:
+            teams[team_id].append(p)
+            # Keep the first player listed for each known position
+            by_position = teams_by_position[team_id]
+            position = p.get("teamPosition")
+            if position in by_position and by_position[position] is None:
+                by_position[position] = p
+        if p["puuid"] == puuid:
+            player = p
+    
+    # Determine which team the player is on
+    allied_id = 100 if player is not None and player["teamId"] == 100 else 200
+    enemy_id = 200 if allied_id == 100 else 100
+    allied_team = teams[allied_id]
+    enemy_team = teams[enemy_id]
+    allied_by_position = teams_by_position[allied_id]
+    enemy_by_position = teams_by_position[enemy_id]
+    
+    # Get match time in minutes
+    game_duration = data["info"]["gameDuration"] / 60  # Convert to minutes
+    
+    # Get game result for player
+    win = player["win"] if player else False
+    
+    # Get match type/mode from queue ID
+    game_type = QUEUE_TYPES.get(queue_id, "Summoner's Rift")  # Default if unknown queue type
+    
+    # Return structured match data
+    return {
+        "match_id": match_id,
+        "duration": game_duration,
+        "win": win,
+        "game_type": game_type,
+        "queue_id": queue_id,
+        "game_version": data["info"]["gameVersion"],
+        "player": player,
+        "allied_team": allied_team,
+        "enemy_team": enemy_team,
+        "allied_by_position": allied_by_position,
+        "enemy_by_position": enemy_by_position
+    }
+
 # ====================================================
 # POPUP WINDOW FOR TEAM QUALITY ASSESSMENT
 # ====================================================
 
+@functools.lru_cache(maxsize=None)
+def load_quality_pixmap(quality_type):
+    """Load the image for a team quality level, returns (pixmap, loaded_from_file)"""
+    # Try to load image from file
+    image_path = f"images/{quality_type}.jpg"
+    if os.path.exists(image_path):
+        # Load actual image file
+        return QPixmap(image_path), True
+        
+    # Create colored placeholder if image doesn't exist
+    placeholder = QPixmap(400, 300)
+    
+    # Different color based on quality type
+    if quality_type == "amazing":
+        placeholder.fill(QColor("#4CAF50"))  # Green
+    elif quality_type == "good":
+        placeholder.fill(QColor("#8BC34A"))  # Light green
+    elif quality_type == "average":
+        placeholder.fill(QColor("#FFC107"))  # Amber
+    elif quality_type == "below_average":
+        placeholder.fill(QColor("#FF9800"))  # Orange
+    else:  # bad
+        placeholder.fill(QColor("#F44336"))  # Red
+        
+    return placeholder, False
+
 class QualityPopupWindow(QDialog):
     """Popup window to display team quality images"""
     def __init__(self, quality_type, parent=None):
         super().__init__(parent)
         self.setWindowTitle(f"Team Quality: {quality_type.upper()}")
         self.setMinimumSize(500, 400)
-        
-        # Set dark theme
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2D2D30;
-                color: #FFFFFF;
-            }
-        """)
+        # Dark theme comes from the main window's stylesheet
         
         # Main layout
         layout = QVBoxLayout(self)
@@ -72,31 +370,11 @@ class QualityPopupWindow(QDialog):
         # Image label
         image_label = QLabel()
         
-        # Try to load image from file
-        image_path = f"images/{quality_type}.jpg"
-        if os.path.exists(image_path):
-            # Load actual image file
-            pixmap = QPixmap(image_path)
-            image_label.setPixmap(pixmap)
+        # Load the image (decoded once and reused for later popups)
+        pixmap, from_file = load_quality_pixmap(quality_type)
+        image_label.setPixmap(pixmap)
+        if from_file:
             image_label.setScaledContents(True)
-        else:
-            # Create colored placeholder if image doesn't exist
-            placeholder = QPixmap(400, 300)
-            
-            # Different color based on quality type
-            if quality_type == "amazing":
-                placeholder.fill(QColor("#4CAF50"))  # Green
-            elif quality_type == "good":
-                placeholder.fill(QColor("#8BC34A"))  # Light green
-            elif quality_type == "average":
-                placeholder.fill(QColor("#FFC107"))  # Amber
-            elif quality_type == "below_average":
-                placeholder.fill(QColor("#FF9800"))  # Orange
-            else:  # bad
-                placeholder.fill(QColor("#F44336"))  # Red
-                
-            # Set placeholder to label
-            image_label.setPixmap(placeholder)
         
         image_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(image_label)
@@ -114,27 +392,14 @@ class QualityPopupWindow(QDialog):
             quality_text = "BAD! Your teammates were significantly underperforming."
             
         text_label = QLabel(quality_text)
-        text_label.setFont(QFont("Arial", 14, QFont.Bold))
+        text_label.setFont(FONT_14_BOLD)
         text_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(text_label)
         
         # Add a close button
         close_button = QPushButton("Close")
+        close_button.setObjectName("closeBtn")
         close_button.setMinimumHeight(40)
-        close_button.setStyleSheet("""
-            QPushButton {
-                background-color: #0A8754;
-                color: white;
-                font-weight: bold;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #0CA66A;
-            }
-            QPushButton:pressed {
-                background-color: #086642;
-            }
-        """)
         close_button.clicked.connect(self.accept)
         layout.addWidget(close_button)
 
@@ -150,6 +415,7 @@ class ApiWorker(QThread):
     finished = pyqtSignal(list)    # Signal emitted when all processing is done
     error = pyqtSignal(str)        # Signal emitted when an error occurs
     progress = pyqtSignal(int)     # Signal to update progress bar
+    match_ready = pyqtSignal(dict) # Signal emitted as each match becomes available
     
     def __init__(self, api_key, nick, tag, region, platform, match_count):
         super().__init__()
@@ -159,44 +425,60 @@ class ApiWorker(QThread):
         self.region = region
         self.platform = platform
         self.match_count = match_count
+        self.last_progress = -1
+        
+        # All requests go to the same regional host
+        self.base_url = f"https://{region}.api.riotgames.com"
+        
+        # The API key is sent with every request on the shared session
+        self.headers = {"X-Riot-Token": api_key}
+        
+        # Cached PUUIDs and matches are kept per API key
+        self.key_hash = api_key_hash(api_key)
+        
+        # Set once queued match requests are no longer needed
+        self.stop_requested = threading.Event()
         
     def run(self):
         """Main method that runs in a separate thread"""
         try:
             # Step 1: Get PUUID (unique player identifier)
-            self.progress.emit(5)
+            self.report_progress(5)
             puuid = self.get_puuid(self.nick, self.tag)
             if not puuid:
                 self.error.emit("Could not retrieve player PUUID. Check your Riot ID and API key.")
                 return
                 
-            self.progress.emit(10)
+            self.report_progress(10)
             
-            # Step 2: Get match IDs - request double the amount to account for filtered games
-            # We need more because some games might be filtered out (ARAM, TFT, etc.)
-            request_count = self.match_count * 2
-            match_ids = self.get_match_ids(puuid, request_count)
+            # Step 2: Get match IDs - request a few extra because some games get filtered out
+            # (ARAM, TFT, etc.); another page is only requested if that is not enough
+            request_count = min(self.match_count + EXTRA_MATCH_IDS, MAX_MATCH_IDS_PER_REQUEST)
+            match_ids = self.get_match_ids(puuid, 0, request_count)
             if not match_ids:
                 self.error.emit("No matches found for this player.")
                 return
                 
-            self.progress.emit(30)
+            self.report_progress(30)
             
-            # Step 3: Get match details for each match
+            # Step 3: Get match details page by page until enough valid matches are found
             results = []
-            for idx, match_id in enumerate(match_ids):
-                # Update progress for each match
-                progress = 30 + int((idx + 1) / len(match_ids) * 70)
-                self.progress.emit(progress)
+            start = 0
+            seen_ids = set()
+            while match_ids:
+                # A game finishing between two page requests shifts the offsets by one,
+                # so the next page can repeat IDs that were already fetched
+                new_ids = [match_id for match_id in match_ids if match_id not in seen_ids]
+                seen_ids.update(new_ids)
+                self.fetch_match_details(puuid, new_ids, results)
+                start += len(match_ids)
+                # Stop once we've reached the desired count or the player's history ran out
+                if len(results) >= self.match_count or len(match_ids) < request_count:
+                    break
+                if start >= MAX_MATCH_HISTORY_SCANNED:
+                    break
+                match_ids = self.get_match_ids(puuid, start, request_count)
                 
-                # Get match data and add to results if valid
-                match_data = self.get_match_details(puuid, match_id)
-                if match_data:
-                    results.append(match_data)
-                    # Stop once we've reached the desired count
-                    if len(results) >= self.match_count:
-                        break
-                        
             # Check if we found any valid matches
             if not results:
                 self.error.emit("No valid Summoner's Rift matches found for this player.")
@@ -208,107 +490,235 @@ class ApiWorker(QThread):
         except Exception as e:
             self.error.emit(f"An error occurred: {str(e)}")
             
+    def api_get(self, url):
+        """Send a GET request to the Riot API, waiting for the rate limiter before every attempt"""
+        for attempt in range(MAX_REQUEST_ATTEMPTS):
+            # Requests still waiting for the limiter are dropped once the analysis no longer needs them
+            if not rate_limiter.wait(self.stop_requested):
+                raise RequestCancelled(url)
+            response = riot_session.get(url, headers=self.headers, timeout=REQUEST_TIMEOUT)
+            if response.status_code != 429 or attempt == MAX_REQUEST_ATTEMPTS - 1:
+                return response
+                
+            # Rate limited - back off for as long as Riot asks, or exponentially if it doesn't say
+            retry_after = response.headers.get("Retry-After", "")
+            delay = int(retry_after) if retry_after.isdigit() else 2 ** attempt
+            if self.stop_requested.wait(delay):
+                raise RequestCancelled(url)
+        
+    def check_rate_limit(self, response):
+        """Raise if a request is still rate limited after all retries
+        
+        Failing loudly keeps a rate limit from being mistaken for a missing player,
+        an empty match history or a skipped match.
+        """
+        if response.status_code == 429:
+            raise RuntimeError("Riot API rate limit exceeded. Please wait a minute and try again.")
+            
+    def report_progress(self, value):
+        """Emit a progress update, skipping values the progress bar already shows"""
+        if value != self.last_progress:
+            self.last_progress = value
+            self.progress.emit(value)
+            
+    def fetch_match_details(self, puuid, match_ids, results):
+        """Fetch match details in parallel, adding valid matches to results until match_count is reached"""
+        # Requests are network-bound, so a small thread pool overlaps their latency
+        next_index = 0  # Index of the next match to hand over to the UI
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            # One future per match ID, kept in the order Riot returned them
+            futures = [executor.submit(self.get_match_details, puuid, match_id) for match_id in match_ids]
+            try:
+                for _ in as_completed(futures):
+                    # Stream matches to the UI once all newer ones are in,
+                    # so they are shown in the order Riot returned them
+                    while next_index < len(futures) and futures[next_index].done():
+                        match_data = futures[next_index].result()
+                        next_index += 1
+                        if match_data and len(results) < self.match_count:
+                            results.append(match_data)
+                            self.match_ready.emit(match_data)
+                            
+                    # Update progress as valid matches come in
+                    self.report_progress(30 + int(len(results) / self.match_count * 70))
+                    
+                    if len(results) >= self.match_count:
+                        break
+            finally:
+                # Drop queued requests once enough matches are found or a request failed;
+                # requests already running stop before they are sent
+                self.stop_requested.set()
+                for future in futures:
+                    future.cancel()
+                    
+        # All pool threads are done, so requests for the next page may be sent again
+        self.stop_requested.clear()
+                    
     def get_puuid(self, nick, tag):
         """Get PUUID (player unique ID) from Riot API using summoner name and tag"""
-        url = f"https://{self.region}.api.riotgames.com/riot/account/v1/accounts/by-riot-id/{nick}/{tag}"
-        headers = {"X-Riot-Token": self.api_key}
-        response = requests.get(url, headers=headers)
+        # Reuse the PUUID from earlier analyses - it only changes if the Riot ID
+        # is renamed and taken by another player, so entries expire after a while
+        cache = load_puuid_cache()
+        cache_key = puuid_cache_key(self.key_hash, self.region, nick, tag)
+        entry = cache.get(cache_key)
+        if isinstance(entry, dict) and time.time() - entry["cached_at"] < PUUID_CACHE_TTL:
+            return entry["puuid"]
+            
+        url = f"{self.base_url}/riot/account/v1/accounts/by-riot-id/{nick}/{tag}"
+        response = self.api_get(url)
+        self.check_rate_limit(response)
         
         # Check if request was successful
         if response.status_code == 200:
-            return response.json()['puuid']
+            puuid = json_loads(response.content)['puuid']
+            cache[cache_key] = {"puuid": puuid, "cached_at": time.time()}
+            save_puuid_cache(cache)
+            return puuid
         else:
-            print(f"Error retrieving PUUID: {response.status_code} - {response.text}")
+            log.warning("Error retrieving PUUID: %s - %s", response.status_code, response.text)
             return None
             
-    def get_match_ids(self, puuid, count=10):
-        """Get list of match IDs for a player"""
-        url = f"https://{self.region}.api.riotgames.com/lol/match/v5/matches/by-puuid/{puuid}/ids?count={count}"
-        headers = {"X-Riot-Token": self.api_key}
-        response = requests.get(url, headers=headers)
+    def get_match_ids(self, puuid, start=0, count=10):
+        """Get a page of match IDs for a player, newest first"""
+        # Re-analyzing shortly after a previous run rarely finds new games, so reuse the list
+        cache_key = (self.region, puuid, start, count)
+        fetched_at, match_ids = match_ids_cache.get(cache_key, (0, None))
+        if match_ids and time.time() - fetched_at < MATCH_IDS_CACHE_TTL:
+            return match_ids
+            
+        url = f"{self.base_url}/lol/match/v5/matches/by-puuid/{puuid}/ids?start={start}&count={count}"
+        response = self.api_get(url)
+        self.check_rate_limit(response)
         
         # Check if request was successful
         if response.status_code == 200:
-            return response.json()
+            match_ids = json_loads(response.content)
+            match_ids_cache[cache_key] = (time.time(), match_ids)
+            return match_ids
         else:
-            print(f"Error retrieving match IDs: {response.status_code} - {response.text}")
+            log.warning("Error retrieving match IDs: %s - %s", response.status_code, response.text)
             return []
             
     def get_match_details(self, puuid, match_id):
         """Get detailed match data for a specific match ID"""
-        url = f"https://{self.region}.api.riotgames.com/lol/match/v5/matches/{match_id}"
-        headers = {
-            "X-Riot-Token": self.api_key,
-            "User-Agent": "Mozilla/5.0"  # Some APIs require a user agent
-        }
-        response = requests.get(url, headers=headers)
-        
-        # Check if request was successful
-        if response.status_code != 200:
-            print(f"Error retrieving match {match_id}: {response.status_code}")
-            return None
+        # Reuse the record if this match was already analyzed in this session
+        try:
+            return get_match_record(match_id, puuid)
+        except KeyError:
+            pass
             
-        # Parse the match data
-        data = response.json()
-        players = data["info"]["participants"]
-        
-        # Skip non-Summoner's Rift games
-        map_id = data["info"]["mapId"]
-        if map_id != 11:  # 11 is Summoner's Rift
-            return None
+        # Use cached match data if this match was fetched before
+        try:
+            data = load_cached_match(self.key_hash, match_id)
+            match_record = build_match_record(data, match_id, puuid)
+            # The player can't be found if the match was cached with another key's PUUIDs
+            cached = match_record is None or match_record["player"] is not None
+        except (OSError, ValueError):
+            cached = False
             
-        # Skip ARAM, TFT, and other non-standard modes
-        queue_id = data["info"]["queueId"]
-        if queue_id in [450, 1090, 1100, 1110, 1130, 1150, 1200]:  # ARAM and various TFT queues
-            return None
-        
-        # Divide players into teams
-        team1 = [p for p in players if p["teamId"] == 100]  # Blue team
-        team2 = [p for p in players if p["teamId"] == 200]  # Red team
-        
-        # Determine which team the player is on
-        player_team = 1 if any(p["puuid"] == puuid for p in team1) else 2
-        allied_team = team1 if player_team == 1 else team2
-        enemy_team = team2 if player_team == 1 else team1
-        
-        # Sort players by position for better display
-        allied_by_position = {}
-        enemy_by_position = {}
-        
-        for position in POSITIONS:
-            allied_by_position[position] = next((p for p in allied_team if p.get("teamPosition") == position), None)
-            enemy_by_position[position] = next((p for p in enemy_team if p.get("teamPosition") == position), None)
-        
-        # Get match time in minutes
-        game_duration = data["info"]["gameDuration"] / 60  # Convert to minutes
-        
-        # Get game result for player
-        player = next((p for p in players if p["puuid"] == puuid), None)
-        win = player["win"] if player else False
-        
-        # Get match type/mode from queue ID
-        queue_id = data["info"]["queueId"]
-        game_type = QUEUE_TYPES.get(queue_id, "Summoner's Rift")  # Default if unknown queue type
-        
-        # Return structured match data
-        return {
-            "match_id": match_id,
-            "duration": game_duration,
-            "win": win,
-            "game_type": game_type,
-            "queue_id": queue_id,
-            "game_version": data["info"]["gameVersion"],
-            "player": player,
-            "allied_team": allied_team,
-            "enemy_team": enemy_team,
-            "allied_by_position": allied_by_position,
-            "enemy_by_position": enemy_by_position
-        }
+        if not cached:
+            url = f"{self.base_url}/lol/match/v5/matches/{match_id}"
+            response = self.api_get(url)
+            self.check_rate_limit(response)
+                
+            # Check if request was successful
+            if response.status_code != 200:
+                log.warning("Error retrieving match %s: %s", match_id, response.status_code)
+                return None
+                
+            # Parse the match data and keep it for future analyses
+            data = json_loads(response.content)
+            save_cached_match(self.key_hash, match_id, data)
+            match_record = build_match_record(data, match_id, puuid)
+            
+        # Never hand a match without the player to the UI, which needs the player's stats
+        if match_record and match_record["player"] is None:
+            log.warning("Player not found in match %s", match_id)
+            match_record = None
+            
+        store_match_record(match_id, puuid, match_record)
+        return match_record
+
+# ====================================================
+# STYLESHEETS AND FONTS
+# ====================================================
+
+# Fonts shared by every card and label instead of being constructed per label
+FONT_12 = QFont("Arial", 12)
+FONT_10_BOLD = QFont("Arial", 10, QFont.Bold)
+FONT_12_BOLD = QFont("Arial", 12, QFont.Bold)
+FONT_14_BOLD = QFont("Arial", 14, QFont.Bold)
+FONT_16_BOLD = QFont("Arial", 16, QFont.Bold)
+
+# Shared by every match card so each stylesheet string is built once
+MATCH_CARD_STYLE = """
+    MatchCardWidget {
+        background-color: #1E1E1E;
+        border: 2px solid #3F3F3F;
+        border-radius: 6px;
+        margin: 10px;
+    }
+"""
+
+POSITION_FRAME_STYLE = """
+    QFrame {
+        border: 1px solid #4f4f4f;
+        background-color: #2D2D30;
+    }
+"""
+
+DAMAGE_FRAME_STYLE = """
+    QFrame {
+        border: 1px solid #4f4f4f;
+        background-color: #2D2D30;
+        padding: 5px;
+    }
+"""
+
+# Match result header colors
+RESULT_STYLE_WIN = "color: #4CAF50;"   # Green for win
+RESULT_STYLE_LOSS = "color: #F44336;"  # Red for loss
+
+# Damage bar height - what the styled QProgressBars used before actually rendered at,
+# since Qt ignored the "height: 10px" in their stylesheet
+DAMAGE_BAR_HEIGHT = 23
+
+# Damage bar colors
+DAMAGE_BAR_BACKGROUND = QColor("#3f3f3f")
+DAMAGE_BAR_BORDER = QColor("#5f5f5f")
+DAMAGE_BAR_USER = QColor("#FFEB3B")   # Yellow for user
+DAMAGE_BAR_ALLY = QColor("#8BC34A")   # Green for ally
+DAMAGE_BAR_ENEMY = QColor("#F44336")  # Red for enemy
 
 # ====================================================
 # MATCH CARD WIDGET - DISPLAYS A SINGLE MATCH
 # ====================================================
 
+class DamageBar(QWidget):
+    """
+    Static horizontal bar showing a player's damage relative to the top damage
+    Painted directly instead of using a styled QProgressBar, which is much heavier
+    """
+    def __init__(self, value, maximum, color, parent=None):
+        super().__init__(parent)
+        self.value = value
+        self.maximum = max(1, maximum)
+        self.color = color
+        self.setFixedHeight(DAMAGE_BAR_HEIGHT)
+        
+    def paintEvent(self, event):
+        """Draw the bar background, the filled part and the border"""
+        painter = QPainter(self)
+        rect = self.rect()
+        painter.fillRect(rect, DAMAGE_BAR_BACKGROUND)
+        
+        # Filled part proportional to value / maximum, inside the 1px border
+        fill_width = int((rect.width() - 2) * min(self.value, self.maximum) / self.maximum)
+        painter.fillRect(1, 1, fill_width, rect.height() - 2, self.color)
+        
+        painter.setPen(DAMAGE_BAR_BORDER)
+        painter.drawRect(rect.adjusted(0, 0, -1, -1))
+
 class MatchCardWidget(QFrame):
     """Widget to display a single match's data in a card format"""
     def __init__(self, match_data, user_puuid, parent=None):
@@ -322,14 +732,7 @@ class MatchCardWidget(QFrame):
         # Set frame style
         self.setFrameShape(QFrame.Box)
         self.setLineWidth(2)
-        self.setStyleSheet("""
-            MatchCardWidget {
-                background-color: #1E1E1E;
-                border: 2px solid #3F3F3F;
-                border-radius: 6px;
-                margin: 10px;
-            }
-        """)
+        self.setStyleSheet(MATCH_CARD_STYLE)
         
         # Main layout
         main_layout = QVBoxLayout(self)
@@ -340,11 +743,11 @@ class MatchCardWidget(QFrame):
         
         # Game type and result
         game_result = "Victory" if self.match_data["win"] else "Defeat"
-        result_color = "#4CAF50" if self.match_data["win"] else "#F44336"  # Green for win, red for loss
+        result_style = RESULT_STYLE_WIN if self.match_data["win"] else RESULT_STYLE_LOSS
         
         game_info = QLabel(f"{self.match_data['game_type']} - {game_result} ({self.match_data['duration']:.1f} min)")
-        game_info.setFont(QFont("Arial", 12, QFont.Bold))
-        game_info.setStyleSheet(f"color: {result_color};")
+        game_info.setFont(FONT_12_BOLD)
+        game_info.setStyleSheet(result_style)
         header_layout.addWidget(game_info)
         header_layout.addStretch()
         
@@ -352,7 +755,7 @@ class MatchCardWidget(QFrame):
         
         # Team title label
         my_team_label = QLabel("MY TEAM")
-        my_team_label.setFont(QFont("Arial", 16, QFont.Bold))
+        my_team_label.setFont(FONT_16_BOLD)
         my_team_label.setAlignment(Qt.AlignCenter)
         my_team_label.setStyleSheet("background-color: #2D2D30; padding: 5px;")
         main_layout.addWidget(my_team_label)
@@ -374,7 +777,7 @@ class MatchCardWidget(QFrame):
         
         # Enemy team label
         enemy_label = QLabel("ENEMY TEAM")
-        enemy_label.setFont(QFont("Arial", 16, QFont.Bold))
+        enemy_label.setFont(FONT_16_BOLD)
         enemy_label.setAlignment(Qt.AlignCenter)
         enemy_label.setStyleSheet("background-color: #2D2D30; padding: 5px;")
         main_layout.addWidget(enemy_label)
@@ -385,12 +788,7 @@ class MatchCardWidget(QFrame):
         position_frame = QFrame()
         position_frame.setFrameShape(QFrame.Box)
         position_frame.setLineWidth(1)
-        position_frame.setStyleSheet("""
-            QFrame {
-                border: 1px solid #4f4f4f;
-                background-color: #2D2D30;
-            }
-        """)
+        position_frame.setStyleSheet(POSITION_FRAME_STYLE)
         
         # Layout for the position frame
         position_layout = QVBoxLayout(position_frame)
@@ -404,7 +802,7 @@ class MatchCardWidget(QFrame):
         # Ally KDA at the top
         if ally:
             is_user = ally["puuid"] == self.user_puuid
-            ally_label = QLabel(self.format_ally_kda(ally, is_user))
+            ally_label = QLabel(self.format_kda(ally))
             ally_label.setAlignment(Qt.AlignCenter)
             if is_user:
                 ally_label.setStyleSheet("color: #FFEB3B; font-size: 10pt; font-weight: bold;")  # Yellow for user
@@ -417,14 +815,14 @@ class MatchCardWidget(QFrame):
         # Position label in the middle
         pos_display = POSITION_DISPLAY.get(position, position)
         pos_label = QLabel(pos_display)
-        pos_label.setFont(QFont("Arial", 14, QFont.Bold))
+        pos_label.setFont(FONT_14_BOLD)
         pos_label.setAlignment(Qt.AlignCenter)
         pos_label.setStyleSheet("color: white;")
         position_layout.addWidget(pos_label)
         
         # Enemy KDA at the bottom
         if enemy:
-            enemy_label = QLabel(self.format_enemy_kda(enemy))
+            enemy_label = QLabel(self.format_kda(enemy))
             enemy_label.setAlignment(Qt.AlignCenter)
             enemy_label.setStyleSheet("color: #F44336; font-size: 10pt;")  # Red for enemy
             position_layout.addWidget(enemy_label)
@@ -433,20 +831,8 @@ class MatchCardWidget(QFrame):
             
         return position_frame
         
-    def format_ally_kda(self, player, is_user=False):
-        """Format KDA display for allied players"""
-        kills = player.get("kills", 0)
-        deaths = player.get("deaths", 0)
-        assists = player.get("assists", 0)
-        champion = player.get("championName", "Unknown")
-        
-        kda_ratio = (kills + assists) / max(1, deaths)  # Avoid division by zero
-        
-        # Format display with champion name and KDA stats
-        return f"{champion}\n{kills}/{deaths}/{assists}\nKDA: {kda_ratio:.1f}"
-        
-    def format_enemy_kda(self, player):
-        """Format KDA display for enemy players"""
+    def format_kda(self, player):
+        """Format KDA display for a player (colors are applied by the caller)"""
         kills = player.get("kills", 0)
         deaths = player.get("deaths", 0)
         assists = player.get("assists", 0)
@@ -463,13 +849,7 @@ class MatchCardWidget(QFrame):
         damage_frame = QFrame()
         damage_frame.setFrameShape(QFrame.Box)
         damage_frame.setLineWidth(1)
-        damage_frame.setStyleSheet("""
-            QFrame {
-                border: 1px solid #4f4f4f;
-                background-color: #2D2D30;
-                padding: 5px;
-            }
-        """)
+        damage_frame.setStyleSheet(DAMAGE_FRAME_STYLE)
         
         # Layout for damage chart
         damage_layout = QVBoxLayout(damage_frame)
@@ -478,21 +858,21 @@ class MatchCardWidget(QFrame):
         
         # Title
         title_label = QLabel("Damage to Champions")
-        title_label.setFont(QFont("Arial", 10, QFont.Bold))
+        title_label.setFont(FONT_10_BOLD)
         title_label.setAlignment(Qt.AlignCenter)
         damage_layout.addWidget(title_label)
         
-        # Get all players from both teams
+        # Get all players from both teams and read each player's damage once
         allies = self.match_data["allied_team"]
         enemies = self.match_data["enemy_team"]
-        all_players = allies + enemies
+        ally_damages = [p.get("totalDamageDealtToChampions", 0) for p in allies]
+        enemy_damages = [p.get("totalDamageDealtToChampions", 0) for p in enemies]
         
-        # Find max damage to scale progress bars
-        max_damage = max(p.get("totalDamageDealtToChampions", 0) for p in all_players)
+        # Find max damage to scale the damage bars
+        max_damage = max(max(ally_damages, default=0), max(enemy_damages, default=0))
         
         # Create bars for allied players
-        for player in allies:
-            player_damage = player.get("totalDamageDealtToChampions", 0)
+        for player, player_damage in zip(allies, ally_damages):
             is_user = player["puuid"] == self.user_puuid
             champion = player.get("championName", "Unknown")
             
@@ -506,42 +886,12 @@ class MatchCardWidget(QFrame):
             
             damage_layout.addWidget(name_label)
             
-            # Progress bar for damage
-            bar = QProgressBar()
-            bar.setTextVisible(False)
-            bar.setMaximum(max_damage)
-            bar.setValue(player_damage)
-            
-            if is_user:
-                bar.setStyleSheet("""
-                    QProgressBar {
-                        border: 1px solid #5f5f5f;
-                        border-radius: 2px;
-                        background-color: #3f3f3f;
-                        height: 10px;
-                    }
-                    QProgressBar::chunk {
-                        background-color: #FFEB3B;
-                    }
-                """)
-            else:
-                bar.setStyleSheet("""
-                    QProgressBar {
-                        border: 1px solid #5f5f5f;
-                        border-radius: 2px;
-                        background-color: #3f3f3f;
-                        height: 10px;
-                    }
-                    QProgressBar::chunk {
-                        background-color: #8BC34A;
-                    }
-                """)
-            
+            # Bar for damage
+            bar = DamageBar(player_damage, max_damage, DAMAGE_BAR_USER if is_user else DAMAGE_BAR_ALLY)
             damage_layout.addWidget(bar)
             
         # Create bars for enemy players
-        for player in enemies:
-            player_damage = player.get("totalDamageDealtToChampions", 0)
+        for player, player_damage in zip(enemies, enemy_damages):
             champion = player.get("championName", "Unknown")
             
             # Format: (ChampionName): damage_value
@@ -550,28 +900,140 @@ class MatchCardWidget(QFrame):
             
             damage_layout.addWidget(name_label)
             
-            # Progress bar for damage
-            bar = QProgressBar()
-            bar.setTextVisible(False)
-            bar.setMaximum(max_damage)
-            bar.setValue(player_damage)
-            
-            bar.setStyleSheet("""
-                QProgressBar {
-                    border: 1px solid #5f5f5f;
-                    border-radius: 2px;
-                    background-color: #3f3f3f;
-                    height: 10px;
-                }
-                QProgressBar::chunk {
-                    background-color: #F44336;
-                }
-            """)
-            
+            # Bar for damage
+            bar = DamageBar(player_damage, max_damage, DAMAGE_BAR_ENEMY)
             damage_layout.addWidget(bar)
         
         return damage_frame
 
+# ====================================================
+# SUMMARY FRAME - DISPLAYS OVERALL STATS
+# ====================================================
+
+class SummaryFrame(QFrame):
+    """Frame with overall stats and team quality assessment, refilled after each analysis"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("summaryFrame")
+        self.setup_ui()
+        
+    def setup_ui(self):
+        """Create the summary labels once; update_stats only changes their text"""
+        self.setFrameShape(QFrame.Box)
+        self.setLineWidth(2)
+        
+        layout = QVBoxLayout(self)
+        
+        # Title
+        self.title_label = QLabel()
+        self.title_label.setFont(FONT_14_BOLD)
+        self.title_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.title_label)
+        
+        # Stats layout
+        stats_layout = QHBoxLayout()
+        
+        self.win_label = QLabel()
+        self.win_label.setFont(FONT_12)
+        stats_layout.addWidget(self.win_label)
+        
+        self.kda_label = QLabel()
+        self.kda_label.setFont(FONT_12)
+        stats_layout.addWidget(self.kda_label)
+        
+        layout.addLayout(stats_layout)
+        
+        assessment_layout = QHBoxLayout()
+        
+        self.team_label = QLabel()
+        self.team_label.setFont(FONT_12)
+        assessment_layout.addWidget(self.team_label)
+        
+        self.enemy_label = QLabel()
+        self.enemy_label.setFont(FONT_12)
+        assessment_layout.addWidget(self.enemy_label)
+        
+        layout.addLayout(assessment_layout)
+        
+        self.quality_label = QLabel()
+        self.quality_label.setFont(FONT_12_BOLD)
+        self.quality_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.quality_label)
+        
+    def update_stats(self, matches):
+        """Fill in the stats for the analyzed matches and return the team quality level"""
+        # Get player name
+        player_name = matches[0]["player"]["summonerName"]
+        self.title_label.setText(f"Analysis Results for {player_name}")
+        
+        # Collect all summary stats in a single pass over the matches
+        total_matches = len(matches)
+        wins = player_kills = player_deaths = player_assists = 0
+        team_kda_sum = enemy_kda_sum = 0.0
+        team_count = enemy_count = 0
+        
+        for match in matches:
+            player = match["player"]
+            if match["win"]:
+                wins += 1
+            player_kills += player["kills"]
+            player_deaths += player["deaths"]
+            player_assists += player["assists"]
+            player_puuid = player["puuid"]
+            
+            # Team stats (excluding player)
+            for ally in match["allied_team"]:
+                if ally["puuid"] == player_puuid:
+                    continue
+                # Deaths are never negative, so "or 1" matches max(1, deaths) without the call
+                team_kda_sum += (ally["kills"] + ally["assists"]) / (ally["deaths"] or 1)
+                team_count += 1
+                
+            # Enemy stats
+            for enemy in match["enemy_team"]:
+                enemy_kda_sum += (enemy["kills"] + enemy["assists"]) / (enemy["deaths"] or 1)
+                enemy_count += 1
+        
+        # Calculate win rate
+        win_rate = (wins / total_matches) * 100
+        
+        self.win_label.setText(f"Win Rate: {wins}/{total_matches} ({win_rate:.1f}%)")
+        
+        # Calculate KDA
+        player_kda = (player_kills + player_assists) / max(1, player_deaths)
+        self.kda_label.setText(f"Overall KDA: {player_kills}/{player_deaths}/{player_assists} ({player_kda:.2f})")
+        
+        # Calculate average KDAs
+        avg_team_kda = team_kda_sum / team_count if team_count else 0
+        avg_enemy_kda = enemy_kda_sum / enemy_count if enemy_count else 0
+        
+        # Team quality assessment
+        team_quality = avg_team_kda / avg_enemy_kda if avg_enemy_kda > 0 else 0
+        
+        self.team_label.setText(f"Team Avg KDA: {avg_team_kda:.2f}")
+        self.enemy_label.setText(f"Enemy Avg KDA: {avg_enemy_kda:.2f}")
+        
+        # Determine quality level based on team quality ratio
+        if team_quality >= 1.3:
+            assessment = "AMAZING - You have exceptional teammates!"
+            quality_type = "amazing"
+        elif team_quality >= 1.1:
+            assessment = "GOOD - Your teammates are performing well"
+            quality_type = "good"
+        elif team_quality >= 0.9:
+            assessment = "AVERAGE - Your teammates are on par with enemies"
+            quality_type = "average"
+        elif team_quality >= 0.7:
+            assessment = "BELOW AVERAGE - Your teammates are struggling a bit"
+            quality_type = "below_average"
+        else:
+            assessment = "BAD - Your teammates are significantly underperforming"
+            quality_type = "bad"
+            
+        self.quality_label.setText(f"Team Quality: {assessment} (Ratio: {team_quality:.2f})")
+        
+        return quality_type
+
 # ====================================================
 # MAIN APPLICATION WINDOW
 # ====================================================
@@ -634,8 +1096,8 @@ class TeamAnalyzerApp(QMainWindow):
         # Region selection
         form_layout.addWidget(QLabel("Region:"), 0, 3)
         self.region_combo = QComboBox()
-        for region in REGIONS.keys():
-            self.region_combo.addItem(region)
+        for region, hosts in REGIONS.items():
+            self.region_combo.addItem(region, hosts)
         form_layout.addWidget(self.region_combo, 1, 3)
         
         # Match count selection
@@ -648,21 +1110,8 @@ class TeamAnalyzerApp(QMainWindow):
         
         # Analyze button
         self.analyze_button = QPushButton("Analyze")
+        self.analyze_button.setObjectName("analyzeBtn")
         self.analyze_button.setMinimumHeight(40)
-        self.analyze_button.setStyleSheet("""
-            QPushButton {
-                background-color: #0A8754;
-                color: white;
-                font-weight: bold;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #0CA66A;
-            }
-            QPushButton:pressed {
-                background-color: #086642;
-            }
-        """)
         self.analyze_button.clicked.connect(self.start_analysis)
         form_layout.addWidget(self.analyze_button, 2, 0, 1, 5)
         
@@ -675,24 +1124,17 @@ class TeamAnalyzerApp(QMainWindow):
         
         # Create a scroll area for match cards
         self.scroll_area = QScrollArea()
+        self.scroll_area.setObjectName("matchScrollArea")
         self.scroll_area.setWidgetResizable(True)
         self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: #2D2D30;
-            }
-        """)
         
-        # Container widget for match cards
-        self.match_container = QWidget()
-        self.match_layout = QVBoxLayout(self.match_container)
-        self.match_layout.setAlignment(Qt.AlignTop)
-        self.match_layout.setContentsMargins(10, 10, 10, 10)
-        self.match_layout.setSpacing(15)
+        # Stats summary, created once and shown above the match cards after each analysis
+        self.summary_frame = SummaryFrame()
+        self.summary_frame.hide()
         
-        self.scroll_area.setWidget(self.match_container)
+        # Container widget for match cards
+        self.create_match_container()
         main_layout.addWidget(self.scroll_area)
         
         # Status bar for app state messages
@@ -705,26 +1147,7 @@ class TeamAnalyzerApp(QMainWindow):
         
     def apply_dark_theme(self):
         """Apply dark theme colors to the application"""
-        dark_palette = QPalette()
-        
-        # Set color scheme for dark theme
-        dark_palette.setColor(QPalette.Window, QColor(53, 53, 53))
-        dark_palette.setColor(QPalette.WindowText, Qt.white)
-        dark_palette.setColor(QPalette.Base, QColor(25, 25, 25))
-        dark_palette.setColor(QPalette.AlternateBase, QColor(53, 53, 53))
-        dark_palette.setColor(QPalette.ToolTipBase, Qt.white)
-        dark_palette.setColor(QPalette.ToolTipText, Qt.white)
-        dark_palette.setColor(QPalette.Text, Qt.white)
-        dark_palette.setColor(QPalette.Button, QColor(53, 53, 53))
-        dark_palette.setColor(QPalette.ButtonText, Qt.white)
-        dark_palette.setColor(QPalette.BrightText, Qt.red)
-        dark_palette.setColor(QPalette.Link, QColor(42, 130, 218))
-        dark_palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
-        dark_palette.setColor(QPalette.HighlightedText, Qt.black)
-        
-        self.setPalette(dark_palette)
-        
-        # Set stylesheet for widgets
+        # Set stylesheet for all widgets, including per-widget rules selected by object name
         self.setStyleSheet("""
             QWidget {
                 background-color: #2D2D30;
@@ -767,6 +1190,26 @@ class TeamAnalyzerApp(QMainWindow):
             QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
                 height: 0px;
             }
+            QPushButton#analyzeBtn, QPushButton#closeBtn {
+                background-color: #0A8754;
+                color: white;
+                font-weight: bold;
+                border-radius: 4px;
+            }
+            QPushButton#analyzeBtn:hover, QPushButton#closeBtn:hover {
+                background-color: #0CA66A;
+            }
+            QPushButton#analyzeBtn:pressed, QPushButton#closeBtn:pressed {
+                background-color: #086642;
+            }
+            QScrollArea#matchScrollArea {
+                border: none;
+            }
+            QFrame#summaryFrame, QFrame#summaryFrame QFrame {
+                background-color: #1E1E1E;
+                border: 2px solid #3F3F3F;
+                border-radius: 6px;
+            }
         """)
         
     def start_analysis(self):
@@ -775,14 +1218,16 @@ class TeamAnalyzerApp(QMainWindow):
         api_key = self.api_input.text().strip()
         nick = self.name_input.text().strip()
         tag = self.tag_input.text().strip()
-        region_key = self.region_combo.currentText()
-        region, platform = REGIONS[region_key]
+        region, platform = self.region_combo.currentData()
         match_count = int(self.count_combo.currentText())
         
         # Validate inputs
         if not api_key or not nick or not tag:
             QMessageBox.warning(self, "Input Error", "Please fill in all fields.")
             return
+        if not RIOT_NAME_PATTERN.fullmatch(nick) or not RIOT_TAG_PATTERN.fullmatch(tag):
+            QMessageBox.warning(self, "Input Error", "Please enter a valid Riot ID (name of 3-16 characters, tag of 3-5).")
+            return
             
         # Clear previous results
         self.clear_matches()
@@ -795,6 +1240,7 @@ class TeamAnalyzerApp(QMainWindow):
         
         # Create and start worker thread
         self.worker = ApiWorker(api_key, nick, tag, region, platform, match_count)
+        self.worker.match_ready.connect(self.append_match)
         self.worker.finished.connect(self.display_results)
         self.worker.error.connect(self.show_error)
         self.worker.progress.connect(self.update_progress)
@@ -811,16 +1257,35 @@ class TeamAnalyzerApp(QMainWindow):
         self.progress_bar.setVisible(False)
         self.statusBar().showMessage("Analysis failed")
         
+    def create_match_container(self):
+        """Create an empty container for match cards and show it in the scroll area"""
+        self.match_container = QWidget()
+        self.match_layout = QVBoxLayout(self.match_container)
+        self.match_layout.setAlignment(Qt.AlignTop)
+        self.match_layout.setContentsMargins(10, 10, 10, 10)
+        self.match_layout.setSpacing(15)
+        self.match_layout.addWidget(self.summary_frame)
+        
+        self.scroll_area.setWidget(self.match_container)
+        
     def clear_matches(self):
         """Clear all previous match cards from display"""
-        while self.match_layout.count():
-            item = self.match_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
+        # Swap in a fresh container; Qt deletes the old one with all its cards in one go.
+        # The summary frame is moved over to the new container and hidden until the next results.
+        self.summary_frame.hide()
+        old_container = self.scroll_area.takeWidget()
+        self.create_match_container()
+        old_container.deleteLater()
                 
+    def append_match(self, match):
+        """Add a match card as soon as the worker has fetched the match"""
+        # Highlight the user's own performance
+        user_puuid = match["player"]["puuid"]
+        match_card = MatchCardWidget(match, user_puuid)
+        self.match_layout.addWidget(match_card)
+        
     def display_results(self, matches):
-        """Display analysis results for all matches"""
+        """Display the summary once all matches have been analyzed"""
         if not matches:
             QMessageBox.information(self, "No Data", "No matches found to analyze.")
             self.analyze_button.setEnabled(True)
@@ -828,135 +1293,17 @@ class TeamAnalyzerApp(QMainWindow):
             self.statusBar().showMessage("Ready")
             return
         
-        # Get the user's PUUID for highlighting their performance
-        user_puuid = matches[0]["player"]["puuid"]
-        
-        # Add stats summary at the top
-        summary_frame = self.create_summary_frame(matches)
-        self.match_layout.addWidget(summary_frame)
-            
-        # Add match cards for each match
-        for match in matches:
-            match_card = MatchCardWidget(match, user_puuid)
-            self.match_layout.addWidget(match_card)
+        # Fill in the stats summary above the match cards that were streamed in
+        quality_type = self.summary_frame.update_stats(matches)
+        self.summary_frame.show()
             
         # Re-enable UI elements
         self.analyze_button.setEnabled(True)
         self.progress_bar.setVisible(False)
         self.statusBar().showMessage("Analysis complete")
         
-    def create_summary_frame(self, matches):
-        """Create a summary frame with overall stats and team quality assessment"""
-        summary_frame = QFrame()
-        summary_frame.setFrameShape(QFrame.Box)
-        summary_frame.setLineWidth(2)
-        summary_frame.setStyleSheet("""
-            QFrame {
-                background-color: #1E1E1E;
-                border: 2px solid #3F3F3F;
-                border-radius: 6px;
-            }
-        """)
-        
-        layout = QVBoxLayout(summary_frame)
-        
-        # Get player name
-        player_name = matches[0]["player"]["summonerName"]
-        
-        # Title
-        title = QLabel(f"Analysis Results for {player_name}")
-        title.setFont(QFont("Arial", 14, QFont.Bold))
-        title.setAlignment(Qt.AlignCenter)
-        layout.addWidget(title)
-        
-        # Stats layout
-        stats_layout = QHBoxLayout()
-        
-        # Calculate win rate
-        total_matches = len(matches)
-        wins = sum(1 for match in matches if match["win"])
-        win_rate = (wins / total_matches) * 100
-        
-        # Win rate label
-        win_label = QLabel(f"Win Rate: {wins}/{total_matches} ({win_rate:.1f}%)")
-        win_label.setFont(QFont("Arial", 12))
-        stats_layout.addWidget(win_label)
-        
-        # Calculate KDAs
-        player_kills = sum(match["player"]["kills"] for match in matches)
-        player_deaths = sum(match["player"]["deaths"] for match in matches)
-        player_assists = sum(match["player"]["assists"] for match in matches)
-        player_kda = (player_kills + player_assists) / max(1, player_deaths)
-        
-        # KDA label
-        kda_label = QLabel(f"Overall KDA: {player_kills}/{player_deaths}/{player_assists} ({player_kda:.2f})")
-        kda_label.setFont(QFont("Arial", 12))
-        stats_layout.addWidget(kda_label)
-        
-        layout.addLayout(stats_layout)
-        
-        # Team quality assessment
-        team_kdas = []
-        enemy_kdas = []
-        
-        # Collect KDA data from all matches
-        for match in matches:
-            # Team stats (excluding player)
-            allies = [p for p in match["allied_team"] if p["puuid"] != match["player"]["puuid"]]
-            for ally in allies:
-                ally_kda = (ally["kills"] + ally["assists"]) / max(1, ally["deaths"])
-                team_kdas.append(ally_kda)
-                
-            # Enemy stats
-            for enemy in match["enemy_team"]:
-                enemy_kda = (enemy["kills"] + enemy["assists"]) / max(1, enemy["deaths"])
-                enemy_kdas.append(enemy_kda)
-        
-        # Calculate average KDAs
-        avg_team_kda = sum(team_kdas) / len(team_kdas) if team_kdas else 0
-        avg_enemy_kda = sum(enemy_kdas) / len(enemy_kdas) if enemy_kdas else 0
-        
-        # Team quality assessment
-        team_quality = avg_team_kda / avg_enemy_kda if avg_enemy_kda > 0 else 0
-        
-        assessment_layout = QHBoxLayout()
-        
-        team_label = QLabel(f"Team Avg KDA: {avg_team_kda:.2f}")
-        team_label.setFont(QFont("Arial", 12))
-        assessment_layout.addWidget(team_label)
-        
-        enemy_label = QLabel(f"Enemy Avg KDA: {avg_enemy_kda:.2f}")
-        enemy_label.setFont(QFont("Arial", 12))
-        assessment_layout.addWidget(enemy_label)
-        
-        layout.addLayout(assessment_layout)
-        
-        # Determine quality level based on team quality ratio
-        if team_quality >= 1.3:
-            assessment = "AMAZING - You have exceptional teammates!"
-            quality_type = "amazing"
-        elif team_quality >= 1.1:
-            assessment = "GOOD - Your teammates are performing well"
-            quality_type = "good"
-        elif team_quality >= 0.9:
-            assessment = "AVERAGE - Your teammates are on par with enemies"
-            quality_type = "average"
-        elif team_quality >= 0.7:
-            assessment = "BELOW AVERAGE - Your teammates are struggling a bit"
-            quality_type = "below_average"
-        else:
-            assessment = "BAD - Your teammates are significantly underperforming"
-            quality_type = "bad"
-            
-        quality_label = QLabel(f"Team Quality: {assessment} (Ratio: {team_quality:.2f})")
-        quality_label.setFont(QFont("Arial", 12, QFont.Bold))
-        quality_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(quality_label)
-        
-        # Show popup with quality image
-        self.show_quality_popup(quality_type)
-        
-        return summary_frame
+        # Show popup with quality image once the results have been painted
+        QTimer.singleShot(0, lambda: self.show_quality_popup(quality_type))
 
 # ====================================================
 # APPLICATION ENTRY POINT